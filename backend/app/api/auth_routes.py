@@ -1,28 +1,89 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
+from redis.exceptions import RedisError
 from backend.app.db.session import get_session
+from backend.app.core.bcrypt_pool import BcryptPool, get_bcrypt_pool
 from backend.app.models.user import User
-from backend.app.core.security import verify_password, hash_password, create_access_token
+from backend.app.schemas.auth import Credentials, Token
+from backend.app.core.security import (
+    DUMMY_HASH, verify_password, hash_password, create_access_token, decode_token_cached, revoke_token
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth")
+bearer_scheme = HTTPBearer()
+
+async def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> dict:
+    try:
+        claims = await decode_token_cached(credentials.credentials)
+    except RedisError:
+        # Revocations live in Redis; without it a logged-out token can't be told apart
+        raise HTTPException(status_code=503, detail="Authentication unavailable, try again shortly")
+    if claims is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    request.state.user = claims
+    return claims
 
 @router.post("/register")
-async def register(username: str, password: str, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(User).where(User.username == username))
-    if result.scalar():
+async def register(
+    creds: Credentials,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    pool: BcryptPool = Depends(get_bcrypt_pool),
+):
+    # Hash before the first query: the session only checks out a connection on first use,
+    # so none is held while this waits in the bcrypt queue
+    password_hash = await pool.run(hash_password, creds.password)
+    taken = await db.scalar(select(exists().where(User.username == creds.username)))
+    if taken:
         raise HTTPException(status_code=400, detail="Username already exists")
-    user = User(username=username, password_hash=hash_password(password))
+    user = User(username=creds.username, password_hash=password_hash)
     db.add(user)
-    await db.commit()
+    try:
+        await db.flush()
+    except IntegrityError:
+        # Lost a race with a concurrent registration of the same username
+        raise HTTPException(status_code=400, detail="Username already exists")
     return {"msg": "User registered"}
 
-@router.post("/login")
-async def login(username: str, password: str, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(select(User).where(User.username == username))
-    user = result.scalar()
-    if not user or not verify_password(password, user.password_hash):
+@router.post("/login", response_model=Token)
+async def login(
+    creds: Credentials,
+    db: AsyncSession = Depends(get_session),
+    pool: BcryptPool = Depends(get_bcrypt_pool),
+):
+    password_hash = await db.scalar(select(User.password_hash).where(User.username == creds.username))
+    # End the read transaction so the pooled connection isn't held while waiting on bcrypt
+    await db.commit()
+    password_ok = await pool.run(
+        verify_password, creds.password, password_hash if password_hash is not None else DUMMY_HASH
+    )
+    if password_hash is None or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    token = create_access_token({"sub": user.username})
-    return {"access_token": token, "token_type": "bearer"}
+    token = create_access_token({"sub": creds.username})
+    # Warm the token cache so the first protected request skips JWT verification (best-effort)
+    try:
+        await decode_token_cached(token)
+    except RedisError:
+        logger.warning("Token cache unavailable at login", exc_info=True)
+    return Token(access_token=token)
+
+@router.post("/logout")
+async def logout(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+    try:
+        await revoke_token(credentials.credentials)
+    except RedisError:
+        raise HTTPException(status_code=503, detail="Logout unavailable, try again shortly")
+    return {"msg": "Logged out"}
+
+@router.get("/me")
+async def me(user: dict = Depends(get_current_user)):
+    return {"username": user["sub"]}
 
@@ -1,7 +1,9 @@
+from functools import partial
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from backend.app.db.session import get_session
+from backend.app.core.cache import cache, cache_response
+from backend.app.db.session import after_commit, get_session
 from backend.app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 from backend.app.crud import project as project_crud
 
@@ -16,13 +18,19 @@ async def health_check():
 @router.post("/projects", response_model=ProjectResponse)
 async def create_project(
     project: ProjectCreate,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session, scope="function")
 ):
     """Create a new project"""
-    return await project_crud.create_project(db, project)
+    db_project = await project_crud.create_project(db, project)
+    after_commit(db, partial(cache.delete_pattern, "projects:*"))
+    return db_project
 
 
 @router.get("/projects", response_model=List[ProjectResponse])
+@cache_response(
+    key=lambda skip, limit, **_: f"projects:list:{skip}:{limit}",
+    response_model=List[ProjectResponse],
+)
 async def list_projects(
     skip: int = 0,
     limit: int = 100,
@@ -33,6 +41,10 @@ async def list_projects(
 
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
+@cache_response(
+    key=lambda project_id, **_: f"projects:{project_id}",
+    response_model=ProjectResponse,
+)
 async def get_project(
     project_id: int,
     db: AsyncSession = Depends(get_session)
@@ -48,23 +60,25 @@ async def get_project(
 async def update_project(
     project_id: int,
     project: ProjectUpdate,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session, scope="function")
 ):
     """Update a project"""
     updated_project = await project_crud.update_project(db, project_id, project)
     if not updated_project:
         raise HTTPException(status_code=404, detail="Project not found")
+    after_commit(db, partial(cache.delete_pattern, "projects:*"))
     return updated_project
 
 
 @router.delete("/projects/{project_id}")
 async def delete_project(
     project_id: int,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_session, scope="function")
 ):
     """Delete a project"""
     success = await project_crud.delete_project(db, project_id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
+    after_commit(db, partial(cache.delete_pattern, "projects:*"))
     return {"status": "success", "message": "Project deleted"}
 
@@ -0,0 +1,31 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException, Request
+
+# Calls allowed in flight or queued before new ones are rejected with 503
+MAX_PENDING = 500
+
+
+class BcryptPool:
+    """Process pool for bcrypt-bound calls, owned by the app lifespan"""
+
+    def __init__(self, max_workers: int = os.cpu_count() or 1, max_pending: int = MAX_PENDING):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._slots = asyncio.Semaphore(max_pending)
+
+    async def run(self, func, *args):
+        """Run func in the pool without blocking the event loop"""
+        if self._slots.locked():
+            raise HTTPException(status_code=503, detail="Server busy, try again shortly", headers={"Retry-After": "1"})
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    def shutdown(self) -> None:
+        # Don't block the event loop waiting for workers; queued hashes are abandoned
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_bcrypt_pool(request: Request) -> BcryptPool:
+    return request.app.state.bcrypt_pool
@@ -0,0 +1,78 @@
+import functools
+import json
+import logging
+from typing import Any, Callable
+from pydantic import TypeAdapter
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """JSON cache over a shared Redis connection pool"""
+
+    def __init__(self, url: str, max_connections: int = 20):
+        self.pool = ConnectionPool.from_url(
+            url, max_connections=max_connections, decode_responses=True
+        )
+        self.client = Redis(connection_pool=self.pool)
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        await self.client.setex(key, ttl_seconds, json.dumps(value))
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """Delete matching keys; on Redis errors stale entries are left to expire by TTL"""
+        try:
+            keys = [key async for key in self.client.scan_iter(match=pattern)]
+            if keys:
+                await self.client.delete(*keys)
+        except RedisError:
+            logger.warning("Cache invalidation failed for %s", pattern, exc_info=True)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.pool.aclose()
+
+
+# Connections are opened lazily; main.lifespan verifies and closes the pool
+cache = RedisCache(settings.REDIS_URL)
+
+
+def cache_response(key: Callable[..., str], response_model: Any, ttl_seconds: int = settings.CACHE_TTL_SECONDS):
+    """Cache a route's serialized response in Redis under key(**route_kwargs)
+
+    Redis errors are logged and treated as a cache miss so reads keep working without Redis.
+    """
+    adapter = TypeAdapter(response_model)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            cache_key = key(**kwargs)
+            try:
+                hit = await cache.get(cache_key)
+            except RedisError:
+                logger.warning("Cache read failed for %s", cache_key, exc_info=True)
+                hit = None
+            if hit is not None:
+                return hit
+
+            result = await func(**kwargs)
+            payload = adapter.dump_python(
+                adapter.validate_python(result, from_attributes=True), mode="json"
+            )
+            try:
+                await cache.set(cache_key, payload, ttl_seconds)
+            except RedisError:
+                logger.warning("Cache write failed for %s", cache_key, exc_info=True)
+            return payload
+
+        return wrapper
+
+    return decorator
@@ -1,24 +1,151 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+from calendar import timegm
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 import bcrypt
+import orjson
+from redis.exceptions import RedisError
+from backend.app.core.cache import cache
 from backend.app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Bound once at import so the token hot path avoids repeated settings attribute lookups
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_SECRET_KEY_BYTES = SECRET_KEY.encode('utf-8')
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# The HS256 header never changes, so its encoded segment is computed once
+_HS256_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
 def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode('utf-8'), hashed.encode('utf-8'))
 
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
+# Verified against for unknown usernames so login timing doesn't reveal which accounts exist
+DUMMY_HASH = hash_password("dummy-password")
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _EXPIRE_SECONDS
+    now = int(time.time())
+    to_encode["exp"] = now + lifetime
+    to_encode.setdefault("iat", now)
+    # A random id makes every token unique, so revoking one session never revokes another
+    # issued to the same user in the same second
+    to_encode.setdefault("jti", secrets.token_urlsafe(16))
+    if ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+def _encode_hs256(claims: dict) -> str:
+    # Match PyJWT: datetime registered claims are encoded as NumericDate, not ISO strings
+    for claim in ("exp", "iat", "nbf"):
+        if isinstance(claims.get(claim), datetime):
+            claims[claim] = timegm(claims[claim].utctimetuple())
+    signing_input = _HS256_HEADER_B64 + b"." + _b64url(orjson.dumps(claims))
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode('ascii')
 
 def decode_token(token: str):
+    if ALGORITHM == "HS256":
+        parts = token.encode('utf-8').split(b".")
+        # Tokens with any other header (e.g. issued by PyJWT with extra fields) take the generic path
+        if len(parts) == 3 and hmac.compare_digest(parts[0], _HS256_HEADER_B64):
+            return _decode_hs256(*parts)
     try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
+def _decode_hs256(header: bytes, payload: bytes, signature: bytes):
+    expected = _b64url(hmac.new(_SECRET_KEY_BYTES, header + b"." + payload, hashlib.sha256).digest())
+    if not hmac.compare_digest(expected, signature):
+        return None
+    try:
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + b"=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(claims, dict):
+        return None
+    now = time.time()
+    exp = claims.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp <= now):
+        return None
+    nbf = claims.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return None
+    return claims
+
+def token_cache_key(token: str) -> str:
+    return "token:" + hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def revoked_key(jti: str) -> str:
+    return "token:revoked:" + jti
+
+def _remaining_ttl(claims: dict):
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return None
+    ttl = int(exp - time.time())
+    return ttl if ttl > 0 else None
+
+async def _is_revoked(claims: dict) -> bool:
+    jti = claims.get("jti")
+    return isinstance(jti, str) and bool(await cache.client.exists(revoked_key(jti)))
+
+async def decode_token_cached(token: str):
+    """Resolve a token's claims from Redis, falling back to JWT verification on a miss
+
+    Fails closed: raises RedisError when the revocation state can't be read, so a
+    logged-out token is never accepted during a Redis outage. Claims are cached under
+    the token's digest rather than its jti: the jti is only trustworthy once the
+    signature has been checked.
+    """
+    key = token_cache_key(token)
+    cached = await cache.client.get(key)
+    if cached is not None:
+        # An empty entry marks a token revoked by logout
+        return json.loads(cached) if cached else None
+    claims = decode_token(token)
+    if claims is None or await _is_revoked(claims):
+        return None
+    # Tokens without an exp claim are verified every time rather than cached indefinitely
+    ttl = _remaining_ttl(claims)
+    if ttl is not None:
+        try:
+            # nx so a revocation written since the lookup is never overwritten
+            await cache.client.set(key, json.dumps(claims), ex=ttl, nx=True)
+        except RedisError:
+            logger.warning("Failed to cache token claims", exc_info=True)
+    return claims
+
+async def revoke_token(token: str) -> None:
+    """Revoke the token's session by jti; raises RedisError when the revocation cannot be stored"""
+    claims = decode_token(token)
+    if claims is None:
+        return
+    # Tokens without an exp claim never expire, so neither does their revocation
+    ttl = _remaining_ttl(claims) if "exp" in claims else None
+    if "exp" in claims and ttl is None:
+        return
+    jti = claims.get("jti")
+    if isinstance(jti, str):
+        await cache.client.set(revoked_key(jti), "", ex=ttl)
+    # Also replace any cached claims, so the hit path sees the revocation without a second lookup
+    await cache.client.set(token_cache_key(token), "", ex=ttl)
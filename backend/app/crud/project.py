@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from typing import List, Optional
 from backend.app.models.project import Project
 from backend.app.schemas.project import ProjectCreate, ProjectUpdate
@@ -12,7 +12,7 @@ async def create_project(db: AsyncSession, project: ProjectCreate) -> Project:
         description=project.description
     )
     db.add(db_project)
-    await db.commit()
+    await db.flush()
     await db.refresh(db_project)
     return db_project
 
@@ -31,27 +31,19 @@ async def get_projects(db: AsyncSession, skip: int = 0, limit: int = 100) -> Lis
 
 async def update_project(db: AsyncSession, project_id: int, project: ProjectUpdate) -> Optional[Project]:
     """Update a project"""
-    db_project = await get_project(db, project_id)
-    if not db_project:
-        return None
-    
-    if project.name is not None:
-        db_project.name = project.name
-    if project.description is not None:
-        db_project.description = project.description
-    
-    await db.commit()
-    await db.refresh(db_project)
-    return db_project
+    values = project.model_dump(exclude_none=True)
+    if not values:
+        return await get_project(db, project_id)
+
+    result = await db.execute(
+        update(Project).where(Project.id == project_id).values(**values).returning(Project)
+    )
+    return result.scalar_one_or_none()
 
 
 async def delete_project(db: AsyncSession, project_id: int) -> bool:
     """Delete a project"""
-    db_project = await get_project(db, project_id)
-    if not db_project:
-        return False
-    
-    await db.delete(db_project)
-    await db.commit()
-    return True
-
+    result = await db.execute(
+        delete(Project).where(Project.id == project_id).returning(Project.id)
+    )
+    return result.scalar_one_or_none() is not None
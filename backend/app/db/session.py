@@ -1,10 +1,30 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Awaitable, Callable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from backend.app.core.config import settings
 
-engine = create_async_engine(settings.POSTGRES_URL, echo=False, future=True)
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+engine = create_async_engine(
+    settings.POSTGRES_URL,
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_timeout=30,
+)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run callback once the request's transaction has committed; skipped on rollback"""
+    session.info.setdefault("after_commit", []).append(callback)
 
 async def get_session() -> AsyncSession:
+    """One transaction per request: committed when the request succeeds, rolled back on error
+
+    Write routes depend on this with scope="function" so the commit happens
+    before the response is sent and a failed commit surfaces as an error.
+    """
     async with AsyncSessionLocal() as session:
-        yield session
+        async with session.begin():
+            yield session
+        for callback in session.info.pop("after_commit", []):
+            await callback()
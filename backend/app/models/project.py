@@ -2,6 +2,8 @@ from sqlalchemy import Column, Integer, String, Text, DateTime, func
 from backend.app.db.base import Base
 
 class Project(Base):
+    # Declare relationships with lazy="raise" and eager-load them in crud/project.py
+    # via selectinload(); async sessions cannot lazy-load during response serialization
     __tablename__ = "projects"
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
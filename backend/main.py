@@ -1,9 +1,35 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from redis.exceptions import RedisError
 from backend.app.api import routes
 from backend.app.api import auth_routes
+from backend.app.core.bcrypt_pool import BcryptPool
+from backend.app.core.cache import cache
 from backend.app.core.config import settings
+from backend.app.db.session import engine
 
-app = FastAPI(title="Project Starter Pro 2 API")
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await cache.client.ping()
+    except RedisError:
+        # The cache is optional at runtime; requests fall back to the database
+        logger.warning("Redis unavailable at startup", exc_info=True)
+    app.state.bcrypt_pool = BcryptPool()
+    # Open the pool's connections up front so the first requests don't pay connection setup
+    connections = await asyncio.gather(*(engine.connect() for _ in range(settings.DB_POOL_SIZE)))
+    await asyncio.gather(*(conn.close() for conn in connections))
+    yield
+    await cache.close()
+    await engine.dispose()
+    app.state.bcrypt_pool.shutdown()
+
+app = FastAPI(title="Project Starter Pro 2 API", lifespan=lifespan)
 
 app.include_router(routes.router)
 app.include_router(auth_routes.router)
@@ -11,3 +37,18 @@ app.include_router(auth_routes.router)
 @app.get("/")
 def root():
     return {"status": "ok", "project": "Project Starter Pro 2"}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Connection pool gauges in Prometheus text exposition format"""
+    pool = engine.pool
+    gauges = {
+        "db_pool_size": ("Configured persistent connections", pool.size()),
+        "db_pool_checked_out": ("Connections currently in use", pool.checkedout()),
+        "db_pool_checked_in": ("Idle connections in the pool", pool.checkedin()),
+        "db_pool_overflow": ("Connections open beyond pool_size", max(pool.overflow(), 0)),
+    }
+    lines = []
+    for name, (help_text, value) in gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,58 @@
+import sys
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+# Make the backend package importable when pytest runs from any directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+
+class StubRedis:
+    """In-memory stand-in for the redis.asyncio client calls the app makes; set down=True to simulate an outage"""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise RedisConnectionError("redis is down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        await self.set(key, value, ex=ttl)
+
+    async def exists(self, *keys):
+        self._check()
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys):
+        self._check()
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match="*"):
+        self._check()
+        for key in list(self.data):
+            if fnmatchcase(key, match):
+                yield key
+
+
+@pytest.fixture
+def redis_stub(monkeypatch):
+    from backend.app.core.cache import cache
+
+    stub = StubRedis()
+    monkeypatch.setattr(cache, "client", stub)
+    return stub
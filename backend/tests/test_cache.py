@@ -0,0 +1,88 @@
+import asyncio
+import logging
+
+import pytest
+from pydantic import BaseModel
+
+from backend.app.core.cache import cache, cache_response
+from backend.app.db import session as db_session
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def make_route(calls):
+    @cache_response(key=lambda item_id, **_: f"items:{item_id}", response_model=Item)
+    async def get_item(item_id: int):
+        calls.append(item_id)
+        return Item(id=item_id, name="first")
+
+    return get_item
+
+
+def test_cache_response_serves_hits_from_redis(redis_stub):
+    calls = []
+    get_item = make_route(calls)
+    assert asyncio.run(get_item(item_id=1)) == {"id": 1, "name": "first"}
+    assert asyncio.run(get_item(item_id=1)) == {"id": 1, "name": "first"}
+    assert calls == [1]
+    assert "items:1" in redis_stub.data
+
+
+def test_cache_response_falls_back_to_the_route_when_redis_is_down(redis_stub, caplog):
+    redis_stub.down = True
+    calls = []
+    get_item = make_route(calls)
+    with caplog.at_level(logging.WARNING, logger="backend.app.core.cache"):
+        assert asyncio.run(get_item(item_id=1)) == {"id": 1, "name": "first"}
+    assert calls == [1]
+    assert [r.getMessage() for r in caplog.records] == ["Cache read failed for items:1", "Cache write failed for items:1"]
+
+
+def test_delete_pattern_tolerates_redis_errors(redis_stub):
+    redis_stub.data["projects:1"] = "{}"
+    redis_stub.down = True
+    asyncio.run(cache.delete_pattern("projects:*"))
+    redis_stub.down = False
+    asyncio.run(cache.delete_pattern("projects:*"))
+    assert redis_stub.data == {}
+
+
+@pytest.fixture
+def sqlite_sessions(monkeypatch):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    monkeypatch.setattr(db_session, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    yield
+    asyncio.run(engine.dispose())
+
+
+async def drive_request(fail: bool):
+    """Run get_session the way FastAPI does for one request, recording when after_commit callbacks fire"""
+    events = []
+    requests = db_session.get_session()
+    session = await anext(requests)
+
+    async def callback():
+        events.append(("callback", session.in_transaction()))
+
+    db_session.after_commit(session, callback)
+    if fail:
+        with pytest.raises(RuntimeError):
+            await requests.athrow(RuntimeError("handler failed"))
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await anext(requests)
+    return events
+
+
+def test_after_commit_runs_once_the_transaction_has_committed(sqlite_sessions):
+    assert asyncio.run(drive_request(fail=False)) == [("callback", False)]
+
+
+def test_after_commit_is_skipped_on_rollback(sqlite_sessions):
+    assert asyncio.run(drive_request(fail=True)) == []
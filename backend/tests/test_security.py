@@ -0,0 +1,126 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from backend.app.core.security import ALGORITHM, SECRET_KEY, create_access_token, decode_token
+
+
+STANDARD_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def sign(signing_input: str, key: str = SECRET_KEY) -> str:
+    return b64url(hmac.new(key.encode(), signing_input.encode(), hashlib.sha256).digest())
+
+
+def hs256_token(header: dict, payload: bytes, key: str = SECRET_KEY) -> str:
+    """Build a token by hand so tests control every byte of the header and payload"""
+    signing_input = b64url(json.dumps(header, separators=(",", ":")).encode()) + "." + b64url(payload)
+    return signing_input + "." + sign(signing_input, key)
+
+
+def claims_token(claims: dict, key: str = SECRET_KEY) -> str:
+    return hs256_token(STANDARD_HEADER, json.dumps(claims).encode(), key)
+
+
+def test_round_trip():
+    token = create_access_token({"sub": "alice"})
+    claims = decode_token(token)
+    assert claims["sub"] == "alice"
+    assert isinstance(claims["exp"], int)
+
+
+def test_token_is_accepted_by_pyjwt():
+    token = create_access_token({"sub": "alice"})
+    claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert claims["sub"] == "alice"
+    assert jwt.get_unverified_header(token) == STANDARD_HEADER
+
+
+def test_pyjwt_token_is_accepted():
+    token = jwt.encode({"sub": "alice", "exp": int(time.time()) + 60}, SECRET_KEY, algorithm="HS256")
+    assert decode_token(token)["sub"] == "alice"
+
+
+def test_datetime_claims_are_encoded_as_numeric_dates():
+    now = datetime.now(timezone.utc)
+    token = create_access_token({"sub": "alice", "iat": now, "nbf": now - timedelta(seconds=5)})
+    claims = decode_token(token)
+    assert claims["iat"] == int(now.timestamp())
+    assert claims["nbf"] == int(now.timestamp()) - 5
+    assert jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])["sub"] == "alice"
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = create_access_token({"sub": "alice"}).split(".")
+    payload = b64url(json.dumps({"sub": "admin", "exp": int(time.time()) + 60}).encode())
+    assert decode_token(f"{header}.{payload}.{signature}") is None
+
+
+def test_tampered_signature_is_rejected():
+    token = create_access_token({"sub": "alice"})
+    header, payload, signature = token.split(".")
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+    assert decode_token(f"{header}.{payload}.{flipped}") is None
+
+
+def test_wrong_key_is_rejected():
+    token = claims_token({"sub": "alice", "exp": int(time.time()) + 60}, key="other-key")
+    assert decode_token(token) is None
+
+
+def test_alg_none_is_rejected():
+    header = b64url(json.dumps({"alg": "none", "typ": "JWT"}).encode())
+    payload = b64url(json.dumps({"sub": "alice", "exp": int(time.time()) + 60}).encode())
+    assert decode_token(f"{header}.{payload}.") is None
+
+
+def test_expired_token_is_rejected():
+    assert decode_token(claims_token({"sub": "alice", "exp": int(time.time()) - 1})) is None
+
+
+def test_future_nbf_is_rejected():
+    now = int(time.time())
+    claims = {"sub": "alice", "exp": now + 60, "nbf": now + 30}
+    assert decode_token(claims_token(claims)) is None
+
+
+def test_non_numeric_exp_is_rejected():
+    assert decode_token(claims_token({"sub": "alice", "exp": "soon"})) is None
+
+
+@pytest.mark.parametrize("payload", [b"[1, 2]", b"not json", b"\xff\xfe"])
+def test_signed_non_object_payload_is_rejected(payload):
+    assert decode_token(hs256_token(STANDARD_HEADER, payload)) is None
+
+
+@pytest.mark.parametrize("token", ["", "a.b", "a.b.c.d", "!!!.@@@.###", "é.é.é", "..."])
+def test_malformed_token_is_rejected(token):
+    assert decode_token(token) is None
+
+
+def test_malformed_payload_with_valid_header_is_rejected():
+    header = b64url(json.dumps(STANDARD_HEADER, separators=(",", ":")).encode())
+    assert decode_token(f"{header}.!!!.abc") is None
+    assert decode_token(f"{header}.é.abc") is None
+
+
+def test_header_with_extra_fields_falls_back_to_pyjwt():
+    claims = {"sub": "alice", "exp": int(time.time()) + 60}
+    token = jwt.encode(claims, SECRET_KEY, algorithm="HS256", headers={"kid": "key-1"})
+    assert decode_token(token)["sub"] == "alice"
+
+
+def test_header_with_extra_fields_and_wrong_key_is_rejected():
+    claims = {"sub": "alice", "exp": int(time.time()) + 60}
+    token = jwt.encode(claims, "other-key-that-is-long-enough-for-hs256", algorithm="HS256", headers={"kid": "key-1"})
+    assert decode_token(token) is None
@@ -0,0 +1,53 @@
+import asyncio
+
+import jwt
+import pytest
+from redis.exceptions import RedisError
+
+from backend.app.core.security import (
+    SECRET_KEY, create_access_token, decode_token, decode_token_cached, revoke_token, token_cache_key,
+)
+
+
+def test_tokens_issued_in_the_same_second_differ():
+    first = create_access_token({"sub": "alice"})
+    second = create_access_token({"sub": "alice"})
+    assert first != second
+    assert decode_token(first)["jti"] != decode_token(second)["jti"]
+
+
+def test_claims_are_cached_until_revoked(redis_stub):
+    token = create_access_token({"sub": "alice"})
+    assert asyncio.run(decode_token_cached(token))["sub"] == "alice"
+    assert redis_stub.data[token_cache_key(token)]
+
+    asyncio.run(revoke_token(token))
+    assert asyncio.run(decode_token_cached(token)) is None
+
+
+def test_login_after_logout_gets_a_working_token(redis_stub):
+    old = create_access_token({"sub": "alice"})
+    asyncio.run(decode_token_cached(old))
+    asyncio.run(revoke_token(old))
+
+    new = create_access_token({"sub": "alice"})
+    assert new != old
+    assert asyncio.run(decode_token_cached(new))["sub"] == "alice"
+    assert asyncio.run(decode_token_cached(old)) is None
+
+
+def test_revocation_covers_other_encodings_of_the_same_session(redis_stub):
+    token = create_access_token({"sub": "alice"})
+    asyncio.run(revoke_token(token))
+    # Same claims, different bytes: only the jti ties it to the revoked session
+    reencoded = jwt.encode(decode_token(token), SECRET_KEY, algorithm="HS256", headers={"kid": "key-1"})
+    assert reencoded != token
+    assert asyncio.run(decode_token_cached(reencoded)) is None
+
+
+def test_revocation_check_fails_closed_when_redis_is_down(redis_stub):
+    token = create_access_token({"sub": "alice"})
+    asyncio.run(revoke_token(token))
+    redis_stub.down = True
+    with pytest.raises(RedisError):
+        asyncio.run(decode_token_cached(token))
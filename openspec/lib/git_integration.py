@@ -1,42 +1,263 @@
-import subprocess
-import json
-from pathlib import Path
+import atexit
+import os
+import sys
+from contextlib import contextmanager
+from functools import cached_property
+# subprocess, shlex, shutil, threading and concurrent.futures are imported where used so that
+# callers which only check enabled() don't pay for them at import time
 
-CONFIG_PATH = Path("openspec/.github-config.json")
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+CONFIG_PATH = os.path.join("openspec", ".github-config.json")
+# Seconds to wait for background pushes when the interpreter exits
+PUSH_EXIT_TIMEOUT = 60
+_NOT_LOADED = object()
+# Instances with queued commits or unfinished pushes; held only while they have work so exit can finish it
+_outstanding = set()
+
+def _finish_outstanding():
+    instances = list(_outstanding)
+    # Flush every queue before waiting, so all pushes are started before any is awaited
+    for gh in instances:
+        gh.flush()
+    for gh in instances:
+        gh.join_pushes(PUSH_EXIT_TIMEOUT)
+
+atexit.register(_finish_outstanding)
+
+def _git_env():
+    # The C locale spares git its locale setup; the rest of the environment is kept for credentials and identity.
+    # Built per call so changes to os.environ after import (tokens, GIT_DIR, identity) are honoured
+    return {**os.environ, "LC_ALL": "C"}
 
 class GitHubIntegration:
     def __init__(self):
-        self.config = self._load_config()
+        # The config file is read on first use, not at construction
+        self._config_mtime = _NOT_LOADED
+        self._config = None
+        self._pending = []
+        self._batch_depth = 0
+        self._pending_pushes = []
+
+    def _track(self):
+        if self._pending or self._pending_pushes:
+            _outstanding.add(self)
+        else:
+            _outstanding.discard(self)
+
+    @cached_property
+    def _git_bin(self):
+        import shutil
+
+        # Resolved once so each call doesn't search PATH again
+        return shutil.which("git") or "git"
+
+    @property
+    def config(self):
+        # Re-parse only when the file changed on disk since the last load
+        mtime = self._stat_config()
+        if mtime != self._config_mtime:
+            self._config_mtime = mtime
+            self._config = self._load_config()
+        return self._config
+
+    def _stat_config(self):
+        try:
+            return os.stat(CONFIG_PATH).st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def _load_config(self):
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r") as f:
-                return json.load(f)
-        return {"enabled": False}
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                return _json.loads(f.read())
+        except FileNotFoundError:
+            return {"enabled": False}
+
+    def run(self, *args, text: bool = True):
+        import subprocess
+
+        return subprocess.run(args, capture_output=True, text=text, env=_git_env(), check=False)
+
+    def _git(self, *args, write: bool = False, text: bool = True):
+        # Read-only calls skip the optional index.lock refresh so they don't contend with writers
+        if write:
+            return self.run(self._git_bin, *args, text=text)
+        return self.run(self._git_bin, "--no-optional-locks", *args, text=text)
+
+    def run_chain(self, *commands, text: bool = True):
+        return self.run("bash", "-c", self._chain_script(*commands), text=text)
 
-    def run(self, *args):
-        return subprocess.run(args, capture_output=True, text=True, check=False)
+    def _chain_script(self, *commands):
+        import shlex
+
+        return " && ".join(shlex.join(cmd) for cmd in commands)
 
     def enabled(self):
         return self.config.get("enabled", False)
 
-    def commit(self, message: str):
+    def commit(self, message: str, files=None, defer: bool = False, async_push: bool = True):
         if not self.enabled():
             return
-        self.run("git", "add", ".")
-        self.run("git", "commit", "-m", message)
-        self.run("git", "push", "origin", "main")
+        if defer or self._batch_depth:
+            self._pending.append((message, files, async_push))
+            self._track()
+            return None
+        return self._commit_and_push(message, files, async_push)
+
+    def flush(self):
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, []
+        self._track()
+        messages = [message for message, _, _ in pending]
+        if any(files is None for _, files, _ in pending):
+            files = None
+        else:
+            files = list(dict.fromkeys(path for _, paths, _ in pending for path in paths))
+        # One caller asking for a synchronous push is enough to push the whole batch synchronously
+        async_push = all(async_push for _, _, async_push in pending)
+        if len(messages) == 1:
+            message = messages[0]
+        else:
+            message = f"openspec: batch ({len(messages)} changes)\n\n" + "\n".join(f"- {m}" for m in messages)
+        return self._commit_and_push(message, files, async_push)
+
+    @contextmanager
+    def batch(self):
+        # Commits made inside the block are combined into one commit and push on exit;
+        # if the block raises they are dropped, since the files may be half-written
+        self._batch_depth += 1
+        queued = len(self._pending)
+        try:
+            yield self
+        except BaseException:
+            del self._pending[queued:]
+            self._track()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def _commit_and_push(self, message: str, files=None, async_push: bool = True):
+        # Staging only the given paths avoids rescanning the whole worktree
+        # With explicit files, the check and the commit are limited to them too, so anything
+        # the user staged separately is neither committed nor able to trigger a commit
+        pathspec = () if files is None else ("--", *files)
+        add = (self._git_bin, "add", ".") if files is None else (self._git_bin, "add", *pathspec)
+        push = (self._git_bin, "push", "origin", "main")
+        commands = [(self._git_bin, "commit", "-m", message, *pathspec), (self._git_bin, "rev-parse", "HEAD")]
+        if not async_push:
+            commands.append(push)
+        # Skip commit, rev-parse and push when staging left the index unchanged
+        staged = (self._git_bin, "diff", "--cached", "--quiet", *pathspec)
+        script = f"{self._chain_script(add)} && {{ {self._chain_script(staged)} || {{ {self._chain_script(*commands)}; }}; }}"
+        result = self.run("bash", "-c", script, text=False)
+        if result.returncode != 0 or not result.stdout:
+            return None
+        if async_push:
+            import subprocess
+
+            self._pending_pushes.append(subprocess.Popen(
+                push, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                env=_git_env(), start_new_session=True,
+            ))
+            self._track()
+        # git push reports on stderr, so the hash is the last line of stdout
+        return result.stdout.rstrip().rsplit(b"\n", 1)[-1].decode("ascii")
+
+    def join_pushes(self, timeout=None):
+        import subprocess
+
+        ok = True
+        pushes, self._pending_pushes = self._pending_pushes, []
+        self._track()
+        for proc in pushes:
+            try:
+                _, err = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                print(f"git push still running after {timeout}s (pid {proc.pid})", file=sys.stderr)
+                ok = False
+                continue
+            if proc.returncode != 0:
+                print(f"git push failed: {err.decode(errors='replace').strip()}", file=sys.stderr)
+                ok = False
+        return ok
+
+    def status(self, fetch: bool = False):
+        if not fetch:
+            return self._worktree_status()
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Scanning the worktree doesn't depend on the fetch, so overlap the two
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            fetching = pool.submit(self._git, "fetch", "origin", "--prune")
+            status = self._worktree_status()
+            fetching.result()
+        if "error" in status:
+            return status
+        # The branch.ab header predates the fetch; recount against the updated upstream
+        counts = self._git("rev-list", "--left-right", "--count", "HEAD...@{upstream}", text=False)
+        if counts.returncode == 0:
+            ahead, behind = counts.stdout.split()
+            status["commits_ahead"] = int(ahead)
+            status["commits_behind"] = int(behind)
+        return status
+
+    def _worktree_status(self):
+        result = self._git("status", "--porcelain=v2", "--branch")
+        if result.returncode != 0:
+            # Reported the way callers already check for, instead of a zeroed status
+            return {"error": result.stderr.strip(), "message": "git status failed"}
+        return self._parse_status(result.stdout)
+
+    def refresh_remote(self):
+        import threading
+
+        # Fetch in the background so status() callers never wait on the network
+        thread = threading.Thread(
+            target=self._git, args=("fetch", "origin", "--prune"), daemon=True
+        )
+        thread.start()
+        return thread
 
-    def status(self):
-        return self.run("git", "status").stdout
+    def _parse_status(self, out):
+        status = {"branch": None, "head": None, "commits_ahead": 0, "commits_behind": 0, "uncommitted_files": 0}
+        # Only the leading "# branch.*" headers need parsing; entries are just counted
+        pos = headers = 0
+        while out.startswith("#", pos):
+            end = out.find("\n", pos)
+            if end == -1:
+                end = len(out)
+            line = out[pos:end]
+            pos = end + 1
+            headers += 1
+            if line.startswith("# branch.oid "):
+                oid = line[len("# branch.oid "):]
+                status["head"] = None if oid == "(initial)" else oid
+            elif line.startswith("# branch.head "):
+                status["branch"] = line[len("# branch.head "):]
+            elif line.startswith("# branch.ab "):
+                ahead, behind = line[len("# branch.ab "):].split()
+                status["commits_ahead"] = int(ahead)
+                status["commits_behind"] = -int(behind)
+        status["uncommitted_files"] = max(out.count("\n") - headers, 0)
+        return status
 
     def sync(self):
         if not self.enabled():
             return "Integration disabled"
-        self.run("git", "pull", "--rebase", "origin", "main")
-        self.run("git", "push", "origin", "main")
+        self.run_chain(
+            (self._git_bin, "pull", "--rebase", "origin", "main"),
+            (self._git_bin, "push", "origin", "main"),
+        )
         return "Sync complete"
 
 if __name__ == "__main__":
     gh = GitHubIntegration()
-    print(gh.status())
+    print(gh.status(fetch="--fetch" in sys.argv[1:]))
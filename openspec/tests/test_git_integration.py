@@ -0,0 +1,220 @@
+import subprocess
+
+import pytest
+
+from openspec.lib import git_integration
+from openspec.lib.git_integration import GitHubIntegration
+
+
+def git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    # Isolate from the user's git config; identity comes from the environment instead
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "OpenSpec Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "openspec@example.com")
+    path = tmp_path / "remote.git"
+    git(tmp_path, "init", "-q", "--bare", "-b", "main", str(path))
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path, remote, monkeypatch):
+    """A clone of a bare remote with one pushed commit and the integration enabled"""
+    path = tmp_path / "repo"
+    git(tmp_path, "clone", "-q", str(remote), str(path))
+    git(path, "checkout", "-q", "-b", "main")
+    (path / "openspec").mkdir()
+    (path / "openspec" / ".github-config.json").write_text('{"enabled": true}')
+    git(path, "add", "-A")
+    git(path, "commit", "-q", "-m", "init")
+    git(path, "push", "-q", "-u", "origin", "main")
+    monkeypatch.chdir(path)
+    return path
+
+
+@pytest.fixture
+def gh(repo):
+    instance = git_integration.GitHubIntegration()
+    yield instance
+    instance.join_pushes(10)
+    git_integration._outstanding.discard(instance)
+
+
+def remote_log(remote):
+    return git(remote, "log", "--format=%s", "main").splitlines()
+
+
+# _parse_status
+
+def test_parse_status_reads_branch_headers():
+    out = (
+        "# branch.oid 1234abcd\n"
+        "# branch.head main\n"
+        "# branch.upstream origin/main\n"
+        "# branch.ab +2 -3\n"
+    )
+    assert GitHubIntegration()._parse_status(out) == {
+        "branch": "main", "head": "1234abcd", "commits_ahead": 2, "commits_behind": 3, "uncommitted_files": 0,
+    }
+
+
+def test_parse_status_counts_entries_after_headers():
+    out = (
+        "# branch.oid 1234abcd\n"
+        "# branch.head main\n"
+        "1 .M N... 100644 100644 100644 aaaa bbbb file.txt\n"
+        "? new.txt\n"
+        "? other.txt\n"
+    )
+    assert GitHubIntegration()._parse_status(out)["uncommitted_files"] == 3
+
+
+def test_parse_status_initial_commit_and_missing_trailing_newline():
+    status = GitHubIntegration()._parse_status("# branch.oid (initial)\n# branch.head main")
+    assert status["head"] is None
+    assert status["branch"] == "main"
+    assert status["uncommitted_files"] == 0
+
+
+def test_chain_script_quotes_each_argument():
+    script = GitHubIntegration()._chain_script(("echo", "a b"), ("echo", "$HOME; rm -rf /"))
+    assert script == "echo 'a b' && echo '$HOME; rm -rf /'"
+
+
+# status
+
+def test_status_of_a_clean_repo(gh, repo):
+    status = gh.status()
+    assert status["branch"] == "main"
+    assert status["head"] == git(repo, "rev-parse", "HEAD")
+    assert (status["commits_ahead"], status["commits_behind"], status["uncommitted_files"]) == (0, 0, 0)
+
+
+def test_status_counts_modified_and_untracked_files(gh, repo):
+    (repo / "openspec" / ".github-config.json").write_text('{"enabled": true, "x": 1}')
+    (repo / "new.txt").write_text("new")
+    assert gh.status()["uncommitted_files"] == 2
+
+
+def test_status_after_fetch_reports_ahead_and_behind(gh, repo, remote, tmp_path):
+    other = tmp_path / "other"
+    git(tmp_path, "clone", "-q", str(remote), str(other))
+    (other / "theirs.txt").write_text("theirs")
+    git(other, "add", "-A")
+    git(other, "commit", "-q", "-m", "theirs")
+    git(other, "push", "-q", "origin", "main")
+    (repo / "ours.txt").write_text("ours")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "ours")
+
+    assert (gh.status()["commits_ahead"], gh.status()["commits_behind"]) == (1, 0)
+    status = gh.status(fetch=True)
+    assert (status["commits_ahead"], status["commits_behind"]) == (1, 1)
+
+
+def test_status_outside_a_repository_reports_an_error(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    status = GitHubIntegration().status()
+    assert status["message"] == "git status failed"
+    assert "not a git repository" in status["error"]
+
+
+# commit
+
+def test_commit_is_skipped_when_disabled(gh, repo):
+    (repo / "openspec" / ".github-config.json").write_text('{"enabled": false}')
+    (repo / "a.txt").write_text("a")
+    assert gh.commit("a", ["a.txt"]) is None
+    assert git(repo, "log", "-1", "--format=%s") == "init"
+
+
+def test_commit_pushes_synchronously(gh, repo, remote):
+    (repo / "a.txt").write_text("a")
+    sha = gh.commit("add a", ["a.txt"], async_push=False)
+    assert sha == git(repo, "rev-parse", "HEAD")
+    assert remote_log(remote)[0] == "add a"
+    assert not gh._pending_pushes
+
+
+def test_commit_pushes_in_the_background(gh, repo, remote):
+    (repo / "a.txt").write_text("a")
+    sha = gh.commit("add a", ["a.txt"])
+    assert gh.join_pushes(10)
+    assert git(remote, "rev-parse", "main") == sha
+
+
+def test_commit_without_changes_makes_no_commit(gh, repo):
+    assert gh.commit("nothing", ["openspec/.github-config.json"], async_push=False) is None
+    assert git(repo, "log", "-1", "--format=%s") == "init"
+
+
+def test_commit_leaves_unrelated_staged_changes_alone(gh, repo):
+    (repo / "unrelated.txt").write_text("mine")
+    git(repo, "add", "unrelated.txt")
+    assert gh.commit("nothing", ["openspec/.github-config.json"], async_push=False) is None
+
+    (repo / "a.txt").write_text("a")
+    gh.commit("add a", ["a.txt"], async_push=False)
+    assert git(repo, "show", "--format=", "--name-only", "HEAD") == "a.txt"
+    assert git(repo, "diff", "--cached", "--name-only") == "unrelated.txt"
+
+
+def test_commit_message_is_passed_verbatim(gh, repo):
+    message = "it's \"quoted\" && $(echo not run)"
+    (repo / "a.txt").write_text("a")
+    gh.commit(message, ["a.txt"], async_push=False)
+    assert git(repo, "log", "-1", "--format=%s") == message
+
+
+# batch and flush
+
+def test_batch_combines_commits(gh, repo, remote):
+    with gh.batch():
+        (repo / "a.txt").write_text("a")
+        assert gh.commit("add a", ["a.txt"]) is None
+        with gh.batch():
+            (repo / "b.txt").write_text("b")
+            gh.commit("add b", ["b.txt"], async_push=False)
+        # The inner block doesn't flush on its own
+        assert git(repo, "log", "-1", "--format=%s") == "init"
+    assert git(repo, "log", "-1", "--format=%B") == "openspec: batch (2 changes)\n\n- add a\n- add b"
+    assert git(repo, "show", "--format=", "--name-only", "HEAD").splitlines() == ["a.txt", "b.txt"]
+    # add b asked for a synchronous push, so the whole batch was pushed synchronously
+    assert not gh._pending_pushes
+    assert remote_log(remote)[0] == "openspec: batch (2 changes)"
+
+
+def test_batch_drops_its_commits_when_the_block_raises(gh, repo):
+    (repo / "a.txt").write_text("a")
+    gh.commit("add a", ["a.txt"], defer=True)
+    try:
+        with gh.batch():
+            (repo / "b.txt").write_text("b")
+            gh.commit("add b", ["b.txt"])
+            raise RuntimeError("half-written")
+    except RuntimeError:
+        pass
+    assert git(repo, "log", "-1", "--format=%s") == "init"
+    assert [message for message, _, _ in gh._pending] == ["add a"]
+
+    gh.flush()
+    assert git(repo, "log", "-1", "--format=%s") == "add a"
+    assert "?? b.txt" in git(repo, "status", "--porcelain")
+
+
+def test_exit_hook_flushes_deferred_commits_and_waits_for_pushes(gh, repo, remote):
+    (repo / "a.txt").write_text("a")
+    gh.commit("add a", ["a.txt"], defer=True)
+    assert gh in git_integration._outstanding
+
+    git_integration._finish_outstanding()
+    assert remote_log(remote)[0] == "add a"
+    assert gh not in git_integration._outstanding